@@ -22,9 +22,17 @@ Setup:
 import os
 import sys
 import re
+import json
+import functools
 import time
+import random
 import shutil
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import questionary
 from rich.console import Console
 from rich.panel import Panel
@@ -52,13 +60,63 @@ SAFE_SIZE_LIMIT_MB = 100
 VIDEO_EXTS = ('.mkv', '.mp4', '.avi', '.m4v', '.iso', '.ts')
 # A tuple of "junk" file extensions. ONLY files with these extensions are eligible for deletion.
 JUNK_EXTS = ('.txt', '.exe', '.bat', '.url', '.lnk', '.jpg', '.png', '.jpeg', '.nzb')
+# A tuple of subtitle/extra extensions. These are renamed to match the movie in the destination folder.
+EXTRA_EXTS = ('.srt', '.sub', '.idx', '.nfo', '.txt', '.jpg', '.png', '.jpeg')
 # A list of terms. Any directory or file containing these terms will be ignored during the scan.
 IGNORE_TERMS = ['sample', 'trailer', 'featurette', 'extras', '@eaDir']
+
+# Successful auto-identifications are remembered here, so unchanged files aren't
+# looked up again on the next run.
+PARSE_CACHE_FILE = os.path.expanduser("~/.cache/radarr-organizer/parse-cache.json")
+
+# Number of parallel lookups used to auto-identify movies during the scan.
+PARSE_WORKERS = 8
+# Number of selected movies that are imported/organized at the same time.
+PROCESS_WORKERS = 4
+# How many times a request is retried when Radarr is busy (429/502/503).
+API_MAX_RETRIES = 3
 # -----------------------------------------------------------------------------
 
 # Initialize the rich library for better terminal output.
 console = Console()
 
+# A single HTTP session shared by all API calls, so connections to Radarr are kept alive
+# and reused instead of being re-opened for every request. The pool holds one connection
+# per worker thread, so parallel lookups never have to open (and then discard) extra ones.
+_SESSION = requests.Session()
+_SESSION.headers.update({"X-Api-Key": API_KEY})
+_ADAPTER = HTTPAdapter(
+    pool_connections=1, # Only one host (Radarr) is ever contacted
+    pool_maxsize=max(PARSE_WORKERS, PROCESS_WORKERS) + 1,
+    max_retries=Retry(total=API_MAX_RETRIES, backoff_factor=0.2, status_forcelist=[429, 502, 503], raise_on_status=False)
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Precompiled single-pass pattern used by sanitize_string. Alternatives, in order:
+#   1. A release tag (resolution, source, codec...) and everything after it.
+#   2. An edition tag as a whole word ('_' counts as a separator, not a word character).
+#   3. A separator character that should become a space.
+_RE_CLEAN = re.compile(
+    r'(?i)([\.\s\-\(\[]+(?:1080p|720p|2160p|4k|bluray|web-dl|webrip|h264|x264|h265|x265|hevc|remux|hdr|aac|dts|ac3|dd5\.1|atmos|truehd).*)'
+    r'|(?<![^\W_])((?:complete|collection|extended|cut|edition))(?![^\W_])'
+    r'|[._()\[\]]'
+)
+# Matches language codes or other suffixes at the end of an extra's filename (e.g. ".eng", "-forced").
+_RE_LANG_SUFFIX = re.compile(r'([._-])([a-z]{2,3}|english|french|german|spanish|italian|forced|sdh|cc)$', re.IGNORECASE)
+# SEARCH_PATHS normalized once, with a trailing slash so that prefix checks stop at a
+# directory boundary ('/Movies/' doesn't match '/Movies2/...'). Pairs of (normalized, original).
+_SEARCH_ROOTS_NORM = [(os.path.normpath(r).rstrip('/') + '/', r) for r in SEARCH_PATHS]
+_SEARCH_ROOTS_SET = frozenset(n for n, _ in _SEARCH_ROOTS_NORM)
+# Lowercased IGNORE_TERMS for O(1) directory-name checks.
+_IGNORE_SET = frozenset(t.lower() for t in IGNORE_TERMS)
+# Matches any of the IGNORE_TERMS inside a file name in one scan, ignoring case.
+_RE_IGNORE = re.compile('(?i)' + '|'.join(re.escape(t.lower()) for t in IGNORE_TERMS))
+# Case-insensitive extension checks, so file names don't have to be lowercased first.
+_RE_VIDEO = re.compile(r'(?i)(?:%s)\Z' % '|'.join(map(re.escape, VIDEO_EXTS)))
+_RE_JUNK = re.compile(r'(?i)(?:%s)\Z' % '|'.join(map(re.escape, JUNK_EXTS)))
+_RE_EXTRAS = re.compile(r'(?i)(?:%s)\Z' % '|'.join(map(re.escape, EXTRA_EXTS)))
+
 # --- UTILS & API ---
 
 def handle_interrupt(signal_received=None, frame=None):
@@ -66,14 +124,14 @@ def handle_interrupt(signal_received=None, frame=None):
     console.print("\n[bold red]Script Interrupted by User. Exiting.[/]")
     sys.exit(0)
 
-def get_headers():
-    """Returns the necessary HTTP headers for Radarr API authentication."""
-    return {"X-Api-Key": API_KEY}
+def in_main_thread():
+    """Returns True when called from the main thread (not from a worker pool)."""
+    return threading.current_thread() is threading.main_thread()
 
 def api_get(endpoint, params=None, raise_errors=False):
     """Performs a GET request to the Radarr API."""
     try:
-        res = requests.get(f"{RADARR_URL}/api/v3{endpoint}", params=params, headers=get_headers())
+        res = _SESSION.get(f"{RADARR_URL}/api/v3{endpoint}", params=params)
         res.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
         return res.json()
     except KeyboardInterrupt: handle_interrupt()
@@ -85,7 +143,7 @@ def api_get(endpoint, params=None, raise_errors=False):
 def api_post(endpoint, json_data):
     """Performs a POST request to the Radarr API."""
     try:
-        res = requests.post(f"{RADARR_URL}/api/v3{endpoint}", json=json_data, headers=get_headers())
+        res = _SESSION.post(f"{RADARR_URL}/api/v3{endpoint}", json=json_data)
         # Check for successful status codes
         if res.status_code not in (200, 201): return False, res.json()
         return True, res.json()
@@ -95,7 +153,7 @@ def api_post(endpoint, json_data):
 def api_put(endpoint, json_data, params=None):
     """Performs a PUT request to the Radarr API."""
     try:
-        res = requests.put(f"{RADARR_URL}/api/v3{endpoint}", json=json_data, params=params, headers=get_headers())
+        res = _SESSION.put(f"{RADARR_URL}/api/v3{endpoint}", json=json_data, params=params)
         # Check for successful status codes (202 is 'Accepted')
         if res.status_code not in (200, 201, 202): return False, res.json()
         return True, res.json()
@@ -123,8 +181,11 @@ def execute_blocking(task_name, func, *args, **kwargs):
     command_id = res['id']
     start_time = time.time()
     timeout = 180  # 3-minute timeout
+    delay = 0.1    # Polling interval, doubled after every poll up to 2 seconds
 
-    with console.status(f"    [yellow]⏳ {task_name}...[/]") as status:
+    # rich can only show one live spinner at a time, so worker threads poll without one.
+    spinner = console.status(f"    [yellow]⏳ {task_name}...[/]") if in_main_thread() else nullcontext()
+    with spinner:
         while True:
             # Check for timeout
             if time.time() - start_time > timeout:
@@ -143,8 +204,10 @@ def execute_blocking(task_name, func, *args, **kwargs):
                     console.print(f"    [red]✖ {task_name} Failed (Radarr Error)[/]")
                     return False
 
-                # Wait briefly before polling again
-                time.sleep(0.5)
+                # Wait before polling again. Quick commands are picked up fast, long ones
+                # are polled less often; the jitter keeps parallel pollers from syncing up.
+                time.sleep(delay * random.uniform(0.8, 1.2))
+                delay = min(delay * 2, 2.0)
 
             except requests.exceptions.HTTPError as e:
                 # A 404 error often means the command finished so quickly it was already cleared.
@@ -159,21 +222,29 @@ def execute_blocking(task_name, func, *args, **kwargs):
 
 # --- FORMATTING ---
 
+def split_ext(name):
+    """
+    A lighter os.path.splitext for bare file names (no directory part).
+    Like splitext, leading dots don't start an extension ('.nfo' has none).
+    """
+    base, dot, ext = name.rpartition('.')
+    if not dot or not base.lstrip('.'): return name, ''
+    return base, '.' + ext
+
+def _clean_replacement(match):
+    """Replacement callback for _RE_CLEAN: tags are dropped, separators become spaces."""
+    return '' if match.lastindex else ' '
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_string(text):
     """Cleans a filename or folder name to make it easier for Radarr to parse."""
     # Remove the extension if it's a video file
-    base, ext = os.path.splitext(text)
+    base, ext = split_ext(text)
     if ext.lower() in VIDEO_EXTS: text = base
-    # Remove common release tags like resolution, source, codecs, etc.
-    text = re.sub(r'(?i)[\.\s\-\(\[]+(1080p|720p|2160p|4k|bluray|web-dl|webrip|h264|x264|h265|x265|hevc|remux|hdr|aac|dts|ac3|dd5\.1|atmos|truehd).*', '', text)
-    # Replace common separators with spaces
-    text = text.replace('(', ' ').replace(')', ' ').replace('[', ' ').replace(']', ' ')
-    text = text.replace('.', ' ').replace('_', ' ')
-    # Remove edition tags
-    text = re.sub(r'(?i)\b(complete|collection|extended|cut|edition)\b', '', text)
+    # In one pass: remove release tags and edition tags, replace separators with spaces
+    text = _RE_CLEAN.sub(_clean_replacement, text)
     # Consolidate multiple spaces into one and trim whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return ' '.join(text.split())
 
 def smart_truncate_path(path, max_len):
     """Shortens a long file path for display in the terminal, keeping the start and end visible."""
@@ -225,57 +296,84 @@ def format_choice(item, widths):
 def is_xml_nfo(path):
     """Checks if an NFO file is XML (Radarr/Kodi) or Text (Scene)."""
     try:
-        # Read the first 500 bytes of the file
-        with open(path, 'rb') as f:
-            content = f.read(500).strip()
-            # XML NFOs usually start with <?xml or contain <movie>
-            if b'<?xml' in content or b'<movie>' in content:
-                return True
-            return False
+        # Read the first 500 bytes of the file with a raw, unbuffered read
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            content = os.read(fd, 500)
+        finally:
+            os.close(fd)
+        # XML NFOs usually start with <?xml or contain <movie>
+        return b'<?xml' in content or b'<movie>' in content
     except:
         # If there's an error reading, assume it's not an XML NFO
         return False
 
-def cleanup_source_folder(source_path, final_movie_path):
+def snapshot_dir(path):
+    """
+    Lists a folder once as (name, size, is_file) tuples, so that several steps can make
+    their decisions from the same listing. size is None if the entry can't be stat'ed.
+    Returns None if the folder can't be read (e.g. it no longer exists).
+    """
+    try:
+        snapshot = []
+        with os.scandir(path) as it:
+            for e in it:
+                try: size = e.stat().st_size
+                except OSError: size = None
+                snapshot.append((e.name, size, e.is_file()))
+        return snapshot
+    except OSError:
+        return None
+
+def cleanup_source_folder(source_path, final_movie_path, snapshot, tag=""):
     """
     Cleans up the original source folder after a movie has been moved.
+    snapshot is the folder listing from snapshot_dir(); tag is put in front of every
+    message (the movie title when several movies are processed in parallel).
     This function contains multiple safety checks to prevent accidental data loss.
     """
-    if not os.path.exists(source_path): return
+    if snapshot is None: return
 
     # SAFETY 1: Never delete the root search paths themselves.
-    norm_source = os.path.normpath(source_path)
-    for root in SEARCH_PATHS:
-        if norm_source == os.path.normpath(root):
-            return
+    if os.path.normpath(source_path).rstrip('/') + '/' in _SEARCH_ROOTS_SET: return
 
-    console.print(f"    [dim]Checking source for cleanup: {source_path}[/]")
+    console.print(f"    {tag}[dim]Checking source for cleanup: {source_path}[/]")
 
     # Get information about the destination to handle NFOs
     dest_dir = os.path.dirname(final_movie_path)
-    dest_basename = os.path.splitext(os.path.basename(final_movie_path))[0]
+    dest_basename = split_ext(os.path.basename(final_movie_path))[0]
 
     try:
-        files = os.listdir(source_path)
-
-        for f in files:
-            full_path = os.path.join(source_path, f)
-            # Skip subdirectories
-            if os.path.isdir(full_path): continue
+        entries = snapshot
+        total = len(entries)
+        removed = 0    # Entries moved away, to know if the folder ends up empty.
+        to_delete = [] # Files that passed every safety check and will be deleted.
+
+        # Videos are never deleted, so if there are no other files there's nothing to check
+        # beyond warning about large videos left behind (Radarr copied instead of moving).
+        if all(_RE_VIDEO.search(name) for name, _, is_file in entries if is_file):
+            for f, size, is_file in entries:
+                if is_file and size is not None and size / (1024 * 1024) > SAFE_SIZE_LIMIT_MB:
+                    console.print(f"    {tag}[yellow]⚠ Skipping large file ({size / (1024 * 1024):.1f} MB): {f}[/]")
+            entries = []
+
+        for f, size, is_file in entries:
+            full_path = f"{source_path}/{f}"
+            # Skip subdirectories (and anything else that isn't a regular file)
+            if not is_file: continue
 
             lower_f = f.lower()
 
             # SAFETY 2: Check File Size. Skip any file larger than the configured limit.
             # This is the primary protection against deleting video files.
-            try:
-                size_mb = os.path.getsize(full_path) / (1024 * 1024)
-                if size_mb > SAFE_SIZE_LIMIT_MB:
-                    console.print(f"    [yellow]⚠ Skipping large file ({size_mb:.1f} MB): {f}[/]")
-                    continue
-            except: continue
+            if size is None: continue
+            size_mb = size / (1024 * 1024)
+            if size_mb > SAFE_SIZE_LIMIT_MB:
+                console.print(f"    {tag}[yellow]⚠ Skipping large file ({size_mb:.1f} MB): {f}[/]")
+                continue
 
             # SAFETY 3: NEVER delete media files. Explicitly check against the video extension list.
-            if lower_f.endswith(VIDEO_EXTS):
+            if _RE_VIDEO.search(f):
                 # We leave it alone. If Radarr moved it, it's gone.
                 # If Radarr copied it, we keep the original as a safeguard.
                 continue
@@ -284,73 +382,83 @@ def cleanup_source_folder(source_path, final_movie_path):
             if lower_f.endswith('.nfo'):
                 if is_xml_nfo(full_path):
                     # XML NFO (Junk, generated by Radarr) - Delete it (if it's small).
-                    os.remove(full_path)
+                    to_delete.append(full_path)
                 else:
                     # Scene NFO (useful text info) - Preserve it by moving it.
                     new_nfo_name = f"{dest_basename}.nfo-orig"
-                    new_nfo_path = os.path.join(dest_dir, new_nfo_name)
+                    new_nfo_path = f"{dest_dir}/{new_nfo_name}"
                     if not os.path.exists(new_nfo_path):
                         try:
                             shutil.move(full_path, new_nfo_path)
-                            console.print(f"    [green]✔ Preserved Scene NFO -> {new_nfo_name}[/]")
+                            removed += 1
+                            console.print(f"    {tag}[green]✔ Preserved Scene NFO -> {new_nfo_name}[/]")
                         except: pass
                     else:
                         # If a destination NFO already exists, just delete the source one.
                         if os.path.abspath(full_path) != os.path.abspath(new_nfo_path):
-                            os.remove(full_path)
+                            to_delete.append(full_path)
                 continue
 
             # --- DELETE JUNK ---
             # SAFETY 4: Only delete files if their extension is explicitly in the JUNK_EXTS list.
-            if lower_f.endswith(JUNK_EXTS):
-                os.remove(full_path)
+            if _RE_JUNK.search(f):
+                to_delete.append(full_path)
                 continue
 
             # Handle "sample" files (only if small, which was checked above)
             if 'sample' in lower_f:
-                os.remove(full_path)
+                to_delete.append(full_path)
                 continue
 
+        # Delete the junk in one tight loop once every file has been classified.
+        for path in to_delete:
+            os.remove(path)
+        removed += len(to_delete)
+
         # SAFETY 5: Try to remove the source folder ONLY if it is now empty.
-        # This will fail safely if a video file or any other unexpected file remains.
-        if not os.listdir(source_path):
-            os.rmdir(source_path)
-            console.print("    [green]✔ Source folder deleted (Empty)[/]")
+        # rmdir refuses non-empty folders, so this also fails safely if a file appeared meanwhile.
+        if removed == total:
+            try:
+                os.rmdir(source_path)
+                console.print(f"    {tag}[green]✔ Source folder deleted (Empty)[/]")
+            except OSError: pass
 
     except Exception as e:
-        console.print(f"    [red]⚠ Cleanup Warning: {e}[/]")
+        console.print(f"    {tag}[red]⚠ Cleanup Warning: {e}[/]")
 
-def manual_rename_extras_destination(folder_path):
-    """Renames subtitles/extras in the DESTINATION folder to match the main movie file."""
-    if not os.path.exists(folder_path): return
-    files = os.listdir(folder_path)
+def manual_rename_extras_destination(folder_path, snapshot):
+    """
+    Renames subtitles/extras in the DESTINATION folder to match the main movie file.
+    snapshot is the folder listing from snapshot_dir().
+    """
+    if snapshot is None: return
     video_file = None
     max_size = 0
-    # Find the largest video file in the folder, assuming it's the main movie.
-    for f in files:
-        if f.lower().endswith(VIDEO_EXTS) and not any(x in f.lower() for x in IGNORE_TERMS):
-            fp = os.path.join(folder_path, f)
-            size = os.path.getsize(fp)
-            if size > max_size:
+    extras = [] # (filename, extension) of subtitles/extras that may need renaming.
+
+    # A single pass over the listing: find the largest video file (assumed to be the
+    # main movie) and collect the extras at the same time.
+    for f, size, _ in snapshot:
+        if _RE_VIDEO.search(f):
+            if not _RE_IGNORE.search(f) and size and size > max_size:
                 max_size = size
                 video_file = f
+            continue
+        m = _RE_EXTRAS.search(f)
+        # Like splitext, a name made of only dots and the extension has no extension.
+        if m and f[:m.start()].lstrip('.'): extras.append((f, m.group()))
 
     if not video_file: return
     # Get the base name of the video file (without extension)
-    video_stem = os.path.splitext(video_file)[0]
-    extra_exts = ('.srt', '.sub', '.idx', '.nfo', '.txt', '.jpg', '.png', '.jpeg')
-
-    # Loop through all files again to find extras that need renaming.
-    for f in files:
-        if f == video_file: continue
-        _, ext = os.path.splitext(f)
-        if ext.lower() not in extra_exts: continue
+    video_stem = split_ext(video_file)[0]
+
+    for f, ext in extras:
         # If the extra file already matches the video stem, skip it.
         if f.startswith(video_stem): continue
 
-        old_stem = os.path.splitext(f)[0]
+        old_stem = f[:-len(ext)]
         # Try to find language codes or other suffixes in the old filename.
-        match = re.search(r'([._-])([a-z]{2,3}|english|french|german|spanish|italian|forced|sdh|cc)$', old_stem, re.IGNORECASE)
+        match = _RE_LANG_SUFFIX.search(old_stem)
 
         new_name = ""
         if match:
@@ -362,8 +470,8 @@ def manual_rename_extras_destination(folder_path):
             new_name = f"{video_stem}{ext}"
 
         try:
-            old_full = os.path.join(folder_path, f)
-            new_full = os.path.join(folder_path, new_name)
+            old_full = f"{folder_path}/{f}"
+            new_full = f"{folder_path}/{new_name}"
             # Rename the file if the new name doesn't already exist.
             if not os.path.exists(new_full):
                 os.rename(old_full, new_full)
@@ -381,6 +489,16 @@ def process_single_item(item, qp_id):
     source_folder = item['current_path']
 
     console.print(f"\n[bold cyan]Processing ({action}): {movie_title}[/]")
+
+    # When several movies are processed in parallel, tag each step and message with its movie.
+    tag = "" if in_main_thread() else f"{movie_title}: "
+
+    def step(task_name):
+        return f"{tag}{task_name}"
+
+    def log(msg):
+        console.print(f"    {tag}{msg}")
+
     movie_id = None
 
     try:
@@ -390,7 +508,7 @@ def process_single_item(item, qp_id):
             movie = item['db_movie']
             movie_id = movie['id']
             movie['path'] = item['current_path']
-            if not execute_blocking("Linking DB Entry", api_put, f"/movie/{movie_id}", movie, {"moveFilesInTheBackground": "false"}):
+            if not execute_blocking(step("Linking DB Entry"), api_put, f"/movie/{movie_id}", movie, {"moveFilesInTheBackground": "false"}):
                 return False
 
         elif action == 'IMPORT':
@@ -405,17 +523,18 @@ def process_single_item(item, qp_id):
                 "monitored": True,
                 "addOptions": {"searchForMovie": False} # Don't search for other releases
             }
-            if not execute_blocking("Importing to DB", api_post, "/movie", payload):
+            if not execute_blocking(step("Importing to DB"), api_post, "/movie", payload):
                 return False
 
             time.sleep(1.0) # Give Radarr a moment to process the new entry.
+            _db_cache.pop(item['tmdb_id'], None) # The cached "not in library" answer is now stale.
 
             # Look up the movie we just added to get its internal Radarr ID.
             lookup = api_get("/movie/lookup", {"term": f"tmdb:{item['tmdb_id']}"})
             if lookup and lookup[0].get('id'):
                 movie_id = lookup[0]['id']
             else:
-                console.print("    [red]✖ Could not verify Import ID[/]")
+                log("[red]✖ Could not verify Import ID[/]")
                 return False
 
         elif action == 'RENAME':
@@ -428,21 +547,21 @@ def process_single_item(item, qp_id):
         # The following steps are executed in order for every movie.
 
         # 2. Rescan: Tell Radarr to scan the movie's current folder to recognize the video file.
-        if not execute_blocking("Registering File (Scan)", api_post, "/command", {"name": "RescanMovie", "movieId": movie_id}): return False
+        if not execute_blocking(step("Registering File (Scan)"), api_post, "/command", {"name": "RescanMovie", "movieId": movie_id}): return False
 
         # 3. Rename Folder: Tell Radarr to move the folder to its final, organized location.
         move_payload = {"movieIds": [movie_id], "rootFolderPath": item['target_root'], "moveFiles": True}
-        if not execute_blocking("Renaming Folder", api_put, "/movie/editor", move_payload): return False
+        if not execute_blocking(step("Renaming Folder"), api_put, "/movie/editor", move_payload): return False
 
         # 4. Rescan: Scan again to update Radarr's database with the new file location.
-        if not execute_blocking("Updating File Location", api_post, "/command", {"name": "RescanMovie", "movieId": movie_id}): return False
+        if not execute_blocking(step("Updating File Location"), api_post, "/command", {"name": "RescanMovie", "movieId": movie_id}): return False
 
         # 5. Rename Files: Tell Radarr to rename the video file itself according to your naming patterns.
         files_res = api_get("/moviefile", {"movieId": movie_id})
         if files_res:
             file_ids = [f['id'] for f in files_res]
             if file_ids:
-                if not execute_blocking("Renaming Video Files", api_post, "/command", {"name": "RenameFiles", "movieId": movie_id, "files": file_ids}): return False
+                if not execute_blocking(step("Renaming Video Files"), api_post, "/command", {"name": "RenameFiles", "movieId": movie_id, "files": file_ids}): return False
 
         # 6. SOURCE CLEANUP & NFO MIGRATION: After Radarr has moved the file, clean the source dir.
         final_path = None
@@ -454,35 +573,36 @@ def process_single_item(item, qp_id):
             # If the source folder is the same as the final path, the movie was already
             # in place (a RELINK scenario). No cleanup is needed.
             if final_path and os.path.normpath(source_folder) == os.path.normpath(final_path):
-                console.print("    [cyan]✔ Movie was already in its final location. Skipping cleanup.[/]")
+                log("[cyan]✔ Movie was already in its final location. Skipping cleanup.[/]")
 
-            elif final_path and os.path.exists(final_path):
+            # List the destination once; the same listing serves the video check and the extras rename.
+            elif final_path and (dest_snapshot := snapshot_dir(final_path)) is not None:
                 found_video = None
-                for f in os.listdir(final_path):
-                    if f.lower().endswith(VIDEO_EXTS) and not any(x in f.lower() for x in IGNORE_TERMS):
-                        found_video = os.path.join(final_path, f)
+                for f, _, _ in dest_snapshot:
+                    if _RE_VIDEO.search(f) and not _RE_IGNORE.search(f):
+                        found_video = f"{final_path}/{f}"
                         break
 
                 if found_video:
                     # Run the safe cleanup function on the original source folder.
-                    cleanup_source_folder(source_folder, found_video)
+                    cleanup_source_folder(source_folder, found_video, snapshot_dir(source_folder), tag)
                     # 7. Destination Extras Rename: Rename subtitles etc. in the new folder.
-                    manual_rename_extras_destination(final_path)
+                    manual_rename_extras_destination(final_path, dest_snapshot)
                 else:
-                    console.print("    [yellow]⚠ Skipping cleanup (Destination video not found)[/]")
+                    log("[yellow]⚠ Skipping cleanup (Destination video not found)[/]")
         except Exception as e:
-            console.print(f"    [red]⚠ Cleanup Error: {e}[/]")
+            log(f"[red]⚠ Cleanup Error: {e}[/]")
 
         # 8. Refresh Metadata: Tell Radarr to download posters, metadata, etc.
-        if not execute_blocking("Downloading Metadata/Images", api_post, "/command", {"name": "RefreshMovie", "movieIds": [movie_id]}): return False
+        if not execute_blocking(step("Downloading Metadata/Images"), api_post, "/command", {"name": "RefreshMovie", "movieIds": [movie_id]}): return False
 
         # 9. Final Scan: One last scan to ensure everything is finalized in Radarr's database.
-        if not execute_blocking("Finalizing (Scan)", api_post, "/command", {"name": "RescanMovie", "movieId": movie_id}): return False
+        if not execute_blocking(step("Finalizing (Scan)"), api_post, "/command", {"name": "RescanMovie", "movieId": movie_id}): return False
 
         return True
 
     except Exception as e:
-        console.print(f"    [red]✖ Exception: {e}[/]")
+        log(f"[red]✖ Exception: {e}[/]")
         return False
 
 # --- LOGIC (Scanning & UI) ---
@@ -496,24 +616,73 @@ def get_quality_profile():
     except KeyboardInterrupt: handle_interrupt()
     except: sys.exit(1)
 
-def get_db_movies():
-    """Fetches all movies from the Radarr database and creates a lookup map."""
-    with console.status("[cyan]Fetching database..."):
-        all_movies = api_get("/movie")
-        # Create a dictionary mapping tmdbId to the movie object for fast lookups.
-        db_map = {m['tmdbId']: m for m in all_movies}
-    return db_map
+# Radarr library entries keyed by tmdbId (None = not in the library), filled on demand.
+_db_cache = {}
+
+def db_lookup(tmdb_id):
+    """
+    Returns the Radarr database entry for a tmdbId, or None if the movie isn't in the library.
+    Each movie is looked up once and cached, instead of downloading the entire library up front.
+    Filtering /movie by tmdbId only queries Radarr's local database (unlike /movie/lookup,
+    which goes out to the metadata server).
+    """
+    if tmdb_id not in _db_cache:
+        res = api_get("/movie", {"tmdbId": tmdb_id})
+        _db_cache[tmdb_id] = res[0] if res else None
+    return _db_cache[tmdb_id]
+
+# Fields of a parsed movie kept in the parse cache.
+_PARSE_CACHE_FIELDS = ('tmdbId', 'title', 'year')
+
+def load_parse_cache():
+    """Loads the auto-identification cache from a previous run (empty if missing, unreadable or malformed)."""
+    try:
+        with open(PARSE_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def cached_movie(cache, path, stamp):
+    """Returns the cached identification for path if its stamp still matches (None on a miss or a malformed entry)."""
+    entry = cache.get(path)
+    if not stamp or not isinstance(entry, dict) or entry.get('stamp') != stamp: return None
+    movie = entry.get('movie')
+    if not isinstance(movie, dict) or not all(k in movie for k in _PARSE_CACHE_FIELDS): return None
+    return movie
+
+def save_parse_cache(cache):
+    """Writes the auto-identification cache atomically (temporary file + rename)."""
+    try:
+        os.makedirs(os.path.dirname(PARSE_CACHE_FILE), exist_ok=True)
+        tmp_path = PARSE_CACHE_FILE + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, PARSE_CACHE_FILE)
+    except OSError as e:
+        console.print(f"[yellow]⚠ Could not save parse cache: {e}[/]")
+
+def is_parseable(clean):
+    """Quick local check that a sanitized name could be a movie title (worth an API call)."""
+    # Digits count: titles like '1917', '300' or '9' are all digits.
+    return len(clean) >= 3 and any(c.isalnum() for c in clean)
 
 def identify_file_auto(filename, foldername):
     """Tries to automatically identify a movie using Radarr's parsing API."""
-    # First, try parsing the more specific filename.
-    res = api_get("/parse", {"title": filename})
-    if 'movie' in res and 'tmdbId' in res['movie'] and res['movie']['tmdbId'] > 0:
-        return res['movie']
+    clean_file = sanitize_string(filename)
+    clean_folder = sanitize_string(foldername)
+    # First, try parsing the more specific filename (unless it obviously isn't a title).
+    if is_parseable(clean_file):
+        res = api_get("/parse", {"title": filename})
+        if 'movie' in res and 'tmdbId' in res['movie'] and res['movie']['tmdbId'] > 0:
+            return res['movie']
+        # The folder carries the same title, so asking again won't help.
+        if clean_folder == clean_file: return None
     # If that fails, try parsing the folder name.
-    res = api_get("/parse", {"title": foldername})
-    if 'movie' in res and 'tmdbId' in res['movie'] and res['movie']['tmdbId'] > 0:
-        return res['movie']
+    if is_parseable(clean_folder):
+        res = api_get("/parse", {"title": foldername})
+        if 'movie' in res and 'tmdbId' in res['movie'] and res['movie']['tmdbId'] > 0:
+            return res['movie']
     # If both fail, return nothing.
     return None
 
@@ -525,7 +694,7 @@ def check_if_rename_needed(movie_id):
     except: return False
     return False
 
-def smart_lookup_ui_immediate(filename, foldername, qp_id, current_root, target_root, db_map, processed_ids):
+def smart_lookup_ui_immediate(filename, foldername, qp_id, current_root, target_root, processed_ids):
     """Provides an interactive UI for manually identifying movies that couldn't be matched automatically."""
     clean_file = sanitize_string(filename)
     clean_folder = sanitize_string(foldername)
@@ -609,9 +778,10 @@ def smart_lookup_ui_immediate(filename, foldername, qp_id, current_root, target_
                 'file_name': filename
             }
             # Determine if this should be a RELINK (already in DB) or IMPORT (new).
-            if tmdb_id in db_map:
+            db_movie = db_lookup(tmdb_id)
+            if db_movie:
                 item['type'] = 'RELINK'
-                item['db_movie'] = db_map[tmdb_id]
+                item['db_movie'] = db_movie
             else:
                 item['type'] = 'IMPORT'
 
@@ -620,12 +790,38 @@ def smart_lookup_ui_immediate(filename, foldername, qp_id, current_root, target_
     except KeyboardInterrupt: handle_interrupt()
     return None
 
-def scan_and_process(db_map, qp_id):
+def fast_walk(root):
+    """
+    Walks a directory tree with os.scandir, depth-first and in the same order as os.walk.
+    Yields (directory, video_files) for every directory. Ignored directories are not
+    entered and ignored files (samples etc.) are left out of the video list.
+    """
+    stack = [root]
+    while stack:
+        current_root = stack.pop()
+        dirs, videos = [], []
+        try:
+            with os.scandir(current_root) as it:
+                for entry in it:
+                    name = entry.name
+                    # DirEntry caches the file type from the directory listing (no extra stat).
+                    if entry.is_dir(follow_symlinks=False):
+                        if name.lower() not in _IGNORE_SET: dirs.append(entry.path)
+                    elif _RE_VIDEO.search(name) and entry.is_file() and not _RE_IGNORE.search(name):
+                        videos.append(name)
+        except OSError: continue
+
+        # Push in reverse so sub-directories are visited in listing order.
+        stack.extend(reversed(dirs))
+        yield current_root, videos
+
+def scan_and_process(qp_id):
     """Scans the SEARCH_PATHS, identifies movies, and categorizes them for processing."""
     candidates = []   # Movies that were automatically identified.
     unidentified = [] # Movies that need manual identification.
     processed_ids = set() # Keep track of movies already found to avoid duplicates.
     anomalies = []    # Folders with issues (e.g., multiple video files).
+    found = []        # (video_file, folder_name, current_root, target_root) awaiting identification.
 
     console.print("[cyan]Scanning disks...[/]")
 
@@ -635,13 +831,9 @@ def scan_and_process(db_map, qp_id):
                 console.print(f"[red]Path not found: {root_path}[/]")
                 continue
 
-            # Walk through the directory tree.
-            for current_root, dirs, files in os.walk(root_path):
-                # Prune ignored directories to avoid scanning them.
-                dirs[:] = [d for d in dirs if d.lower() not in IGNORE_TERMS]
-                # Find video files in the current directory, ignoring samples etc.
-                videos = [f for f in files if f.lower().endswith(VIDEO_EXTS) and not any(x in f.lower() for x in IGNORE_TERMS)]
-
+            # Walk through the directory tree. Starting from the normalized root keeps
+            # every visited path normalized too.
+            for current_root, videos in fast_walk(os.path.normpath(root_path)):
                 if not videos: continue # Skip folders with no videos.
                 if len(videos) > 1:
                     # Flag folders with more than one video file as anomalies for manual review.
@@ -653,57 +845,97 @@ def scan_and_process(db_map, qp_id):
 
                 # Determine which root path this movie belongs to.
                 target_root = None
-                for r in SEARCH_PATHS:
-                    if os.path.normpath(current_root).startswith(os.path.normpath(r)):
+                norm_cur = current_root.rstrip('/') + '/'
+                for norm_r, r in _SEARCH_ROOTS_NORM:
+                    if norm_cur.startswith(norm_r):
                         target_root = r
                         break
                 if not target_root: continue
 
-                # Try to automatically identify the movie.
-                parsed = identify_file_auto(video_file, folder_name)
-
-                if parsed:
-                    tmdb_id = parsed['tmdbId']
-                    if tmdb_id in processed_ids: continue
-
-                    # Build the item dictionary for a successfully identified movie.
-                    item = {
-                        'tmdb_id': tmdb_id,
-                        'title': parsed['title'],
-                        'year': parsed['year'],
-                        'current_path': current_root,
-                        'target_root': target_root,
-                        'display': f"{parsed['title']} ({parsed['year']})",
-                        'file_name': video_file
-                    }
-
-                    # Categorize the action needed for this movie.
-                    if tmdb_id not in db_map:
-                        item['type'] = 'IMPORT'
+                found.append((video_file, folder_name, current_root, target_root))
+
+        # Reuse identifications from earlier runs for video files that haven't changed
+        # since (same path, modification time and size).
+        parse_cache = load_parse_cache()
+        results = [None] * len(found)
+        stamps = []  # (path, [mtime, size]) per candidate; stamp is None if the file can't be stat'ed.
+        todo = []    # Indexes into found that still need an API lookup.
+        for i, (video_file, _, current_root, _) in enumerate(found):
+            path = f"{current_root}/{video_file}"
+            try:
+                st = os.stat(path)
+                stamp = [int(st.st_mtime), st.st_size]
+            except OSError:
+                stamp = None
+            stamps.append((path, stamp))
+            results[i] = cached_movie(parse_cache, path, stamp)
+            if results[i] is None:
+                todo.append(i)
+
+        def identify(i):
+            """Identifies found[i] (unless cached) and prefetches its library entry."""
+            parsed = results[i] or identify_file_auto(found[i][0], found[i][1])
+            if parsed: db_lookup(parsed['tmdbId'])
+            return parsed
+
+        # Try to automatically identify the remaining movies and check which are already in
+        # the library. The lookups are network-bound, so run them in parallel; map() keeps
+        # the results in scan order.
+        with console.status(f"[cyan]Identifying {len(todo)} movies ({len(found) - len(todo)} cached)..."):
+            with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+                results = list(executor.map(identify, range(len(found))))
+
+        # Rebuild the cache from this scan only, so entries for files Radarr has since moved
+        # (or that were deleted) don't pile up from run to run.
+        parse_cache = {}
+        for (path, stamp), parsed in zip(stamps, results):
+            if parsed and stamp:
+                parse_cache[path] = {'stamp': stamp, 'movie': {k: parsed[k] for k in _PARSE_CACHE_FIELDS}}
+        save_parse_cache(parse_cache)
+
+        for (video_file, folder_name, current_root, target_root), parsed in zip(found, results):
+            if parsed:
+                tmdb_id = parsed['tmdbId']
+                if tmdb_id in processed_ids: continue
+
+                # Build the item dictionary for a successfully identified movie.
+                item = {
+                    'tmdb_id': tmdb_id,
+                    'title': parsed['title'],
+                    'year': parsed['year'],
+                    'current_path': current_root,
+                    'target_root': target_root,
+                    'display': f"{parsed['title']} ({parsed['year']})",
+                    'file_name': video_file
+                }
+
+                # Categorize the action needed for this movie (the entry was prefetched above).
+                db_movie = db_lookup(tmdb_id)
+                if not db_movie:
+                    item['type'] = 'IMPORT'
+                    candidates.append(item)
+                    processed_ids.add(tmdb_id)
+                else:
+                    item['db_movie'] = db_movie
+                    # If movie is in DB but has no file, it needs to be relinked.
+                    if not db_movie['hasFile']:
+                        item['type'] = 'RELINK'
                         candidates.append(item)
                         processed_ids.add(tmdb_id)
                     else:
-                        db_movie = db_map[tmdb_id]
-                        item['db_movie'] = db_movie
-                        # If movie is in DB but has no file, it needs to be relinked.
-                        if not db_movie['hasFile']:
-                            item['type'] = 'RELINK'
+                         # If it has a file, check if it needs renaming.
+                         if check_if_rename_needed(db_movie['id']):
+                            item['type'] = 'RENAME'
                             candidates.append(item)
                             processed_ids.add(tmdb_id)
-                        else:
-                             # If it has a file, check if it needs renaming.
-                             if check_if_rename_needed(db_movie['id']):
-                                item['type'] = 'RENAME'
-                                candidates.append(item)
-                                processed_ids.add(tmdb_id)
-                else:
-                    # If auto-identification fails, add it to the unidentified list.
-                    unidentified.append({
-                        'file': video_file,
-                        'folder': folder_name,
-                        'root': current_root,
-                        'target': target_root
-                    })
+            else:
+                # If auto-identification fails, add it to the unidentified list.
+                unidentified.append({
+                    'file': video_file,
+                    'folder': folder_name,
+                    'root': current_root,
+                    'target': target_root
+                })
     except KeyboardInterrupt: handle_interrupt()
 
     return candidates, unidentified, anomalies, processed_ids
@@ -717,19 +949,18 @@ def main():
     try: api_get("/system/status")
     except: return
 
-    # Get user input and initial data from Radarr.
+    # Get user input from Radarr.
     qp_id = get_quality_profile()
-    db_map = get_db_movies()
 
     # Scan the disks to find all potential movies to process.
-    candidates, unidentified, anomalies, processed_ids = scan_and_process(db_map, qp_id)
+    candidates, unidentified, anomalies, processed_ids = scan_and_process(qp_id)
 
     # Handle unidentified files first.
     if unidentified:
         console.print(f"\n[bold yellow]Found {len(unidentified)} unidentified files.[/]")
         if questionary.confirm("Do you want to review and manually identify them now?").ask():
             for item in unidentified:
-                result = smart_lookup_ui_immediate(item['file'], item['folder'], qp_id, item['root'], item['target'], db_map, processed_ids)
+                result = smart_lookup_ui_immediate(item['file'], item['folder'], qp_id, item['root'], item['target'], processed_ids)
                 if result == "SKIP_ALL":
                     console.print("[yellow]Skipping remaining manual reviews...[/]")
                     break
@@ -758,8 +989,14 @@ def main():
             # Process each item the user selected.
             if selected:
                 console.print(f"\n[bold white on red] Processing {len(selected)} items... [/]")
-                for item in selected:
-                    process_single_item(item, qp_id)
+                # Each movie lives in its own folder, so the pipelines are independent and
+                # can overlap their disk I/O and Radarr command polling.
+                executor = ThreadPoolExecutor(max_workers=PROCESS_WORKERS)
+                try:
+                    list(executor.map(lambda it: process_single_item(it, qp_id), selected))
+                finally:
+                    # On Ctrl+C, don't start any more movies; the ones in progress finish their pipeline.
+                    executor.shutdown(wait=False, cancel_futures=True)
 
         except KeyboardInterrupt: handle_interrupt()
 
@@ -31,10 +31,20 @@ Usage:
 
 import os
 import argparse
+import errno
+import functools
 import re
 import shutil
 import sys
-from collections import defaultdict
+import threading
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
 
 # --- Configuration ---
 
@@ -47,21 +57,63 @@ MIN_FREE_BUFFER = 100 * 1024 * 1024 * 1024  # 100 GiB
 MIN_VIDEO_SIZE = 50 * 1024 * 1024           # 50 MB
 
 # Regex pattern to identify Season/Episode numbers (e.g., S01E05).
-PATTERN = re.compile(r'(?i)S(\d+)E(\d+)')
+# Explicit [Ss]/[Ee] classes instead of (?i) let the regex engine skip ahead to candidate
+# positions instead of case-folding every character of every filename.
+PATTERN = re.compile(r'[Ss](\d+)[Ee](\d+)')
+
+# Number of series folders scanned in parallel on each root path.
+# Overlapping the directory reads helps most on network mounts (NAS/SMB).
+SERIES_SCAN_WORKERS = 8
+
+# Number of episodes moved/deleted in parallel per series in live mode (--execute).
+ACTION_WORKERS = 8
+
+# Number of series scanned ahead of the consolidation step. Bounds how much of the
+# library is held in memory at once.
+SCAN_AHEAD = 64
+
+# ioctl request to reflink (clone) a whole file, from linux/fs.h.
+FICLONE = 0x40049409
+
+# Subfolders holding bonus material (Plex/Jellyfin naming). Files below these are never
+# treated as episodes, even if named SxxExx; they are carried along as artifacts.
+EXTRAS_DIRS = {'extras', 'featurettes', 'behind the scenes', 'deleted scenes', 'interviews',
+               'scenes', 'shorts', 'trailers', 'sample', 'samples', 'other'}
+
+# Whether directories can be opened and modified relative to an fd (Linux, BSD, macOS).
+_USE_DIR_FD = (hasattr(os, 'O_DIRECTORY') and os.scandir in os.supports_fd
+               and {os.open, os.remove, os.rmdir} <= os.supports_dir_fd)
 
 # Files to aggressively clean if they are left behind in an otherwise empty folder.
 JUNK_FILES = {'.plexmatch', '.ds_store', 'thumbs.db', 'desktop.ini'}
 
+# Patterns used by normalize_name.
+_DOT_UND = re.compile(r'[._]')
+_MULTI_WS = re.compile(r'\s+')
+
+# Serializes console output from worker threads (see log).
+_print_lock = threading.Lock()
+
+def log(msg):
+    """
+    Prints one line. Scans and live moves run on worker threads, and a bare print()
+    writes the text and the newline separately, so lines could interleave without the lock.
+    """
+    with _print_lock:
+        print(msg)
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name):
     """
     Normalizes a show name for comparison.
     'The.Homers' -> 'the homers'
     'The_Homerss' -> 'the homers'
+    Cached, since the same folder names repeat across disks.
     """
     # Replace dots and underscores with spaces, strip, lowercase
-    clean = re.sub(r'[._]', ' ', name).strip().lower()
+    clean = _DOT_UND.sub(' ', name).strip().lower()
     # Collapse multiple spaces
-    return re.sub(r'\s+', ' ', clean)
+    return _MULTI_WS.sub(' ', clean)
 
 def get_free_space(path):
     """Returns the number of free bytes on the filesystem containing path."""
@@ -71,39 +123,123 @@ def get_free_space(path):
     except OSError:
         return 0
 
-def get_file_info(path):
-    """Returns file size in bytes, or -1 on error."""
-    try:
-        return os.path.getsize(path)
-    except OSError:
-        return -1
+# Filesystem id (st_dev) per root path, and free bytes per filesystem, measured once
+# per run (see get_free_space_cached).
+_fs_ids = {}
+_free_cache = {}
+
+def get_fs_id(path):
+    """Returns the id of the filesystem containing path (its st_dev), cached per path."""
+    fs_id = _fs_ids.get(path)
+    if fs_id is None:
+        try:
+            fs_id = os.stat(path).st_dev
+        except OSError:
+            fs_id = path # Unknown, keep it apart from every other root
+        _fs_ids[path] = fs_id
+    return fs_id
+
+def get_free_space_cached(path):
+    """
+    Like get_free_space, but asks each filesystem only once. Roots on the same filesystem
+    share one value; in live mode, moves onto it are deducted from it by the caller.
+    """
+    fs_id = get_fs_id(path)
+    if fs_id not in _free_cache:
+        _free_cache[fs_id] = get_free_space(path)
+    return _free_cache[fs_id]
 
 # --- Action Functions ---
 
+def _reflink(src, dst_path):
+    """
+    Tries to clone src into dst_path with FICLONE (btrfs, XFS). This shares the data
+    blocks, so it completes instantly regardless of file size.
+    Returns False if the filesystem (or platform) doesn't support it.
+    """
+    if fcntl is None: return False
+    with open(src, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            return False
+
+def _drop_cache(path):
+    """
+    Flushes a freshly copied file to disk, then asks the kernel to drop its pages from
+    the page cache (POSIX_FADV_DONTNEED only drops clean pages, hence the flush first).
+    The copied episode isn't read again by this run, and leaving several GB of it cached
+    would evict the directory metadata the rest of the run still uses. The flush also
+    makes the copy durable before the caller unlinks the source.
+    No-op where posix_fadvise is unavailable. Raises OSError if the flush fails, so the
+    source is kept; the cache hint itself is best effort.
+    """
+    if not hasattr(os, 'posix_fadvise'): return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fdatasync(fd)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+    finally:
+        os.close(fd)
+
+def _move_file(src, dst_path):
+    """
+    Moves a single file, replacing dst_path if it exists.
+    Uses a plain rename when possible. Across filesystems the data is reflinked if
+    supported, otherwise copied with shutil.copyfile (which uses in-kernel sendfile on
+    Linux), flushed and evicted from the page cache; then metadata is copied and the source removed.
+    """
+    try:
+        os.rename(src, dst_path)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV: raise
+
+    if os.path.islink(src):
+        # Leave symlinks to shutil, which recreates the link instead of copying the target
+        shutil.move(src, dst_path)
+        return
+
+    if not _reflink(src, dst_path):
+        shutil.copyfile(src, dst_path)
+        _drop_cache(dst_path)
+    shutil.copystat(src, dst_path)
+    os.unlink(src)
+
+
 def safe_move(src, dest_dir, dry_run=True):
     """
     Moves a file to dest_dir, ensuring the destination doesn't already exist.
     """
     try:
-        if not os.path.exists(src):
-            print(f"  [ERROR] Source missing: {src}")
+        if dry_run and not os.path.exists(src):
+            log(f"  [ERROR] Source missing: {src}")
             return False
 
         dst_path = os.path.join(dest_dir, os.path.basename(src))
 
         if os.path.exists(dst_path):
-            print(f"  [ABORT] Video collision: Target exists at {dst_path}")
+            log(f"  [ABORT] Video collision: Target exists at {dst_path}")
             return False
 
         if not dry_run:
             os.makedirs(dest_dir, exist_ok=True)
-            shutil.move(src, dst_path)
-            print(f"  [MOVED] {src} -> {dst_path}")
+            # No separate existence check for the source: the move itself reports it
+            try:
+                _move_file(src, dst_path)
+            except FileNotFoundError:
+                log(f"  [ERROR] Source missing: {src}")
+                return False
+            log(f"  [MOVED] {src} -> {dst_path}")
         else:
-            print(f"  [DRY-RUN] mv {src} -> {dest_dir}/")
+            log(f"  [DRY-RUN] mv {src} -> {dest_dir}/")
         return True
     except Exception as e:
-        print(f"  [CRITICAL ERROR] Failed moving {src}: {e}")
+        log(f"  [CRITICAL ERROR] Failed moving {src}: {e}")
         return False
 
 def force_move(src, dest_dir, dry_run=True):
@@ -113,235 +249,429 @@ def force_move(src, dest_dir, dry_run=True):
     or they are assumed identical/expendable.
     """
     try:
-        if not os.path.exists(src): return False
         dst_path = os.path.join(dest_dir, os.path.basename(src))
 
         if not dry_run:
             os.makedirs(dest_dir, exist_ok=True)
-            if os.path.exists(dst_path):
-                os.remove(dst_path)
-            shutil.move(src, dst_path)
-            print(f"  [MERGED] {src} -> {dest_dir}/")
+            # _move_file overwrites an existing file (rename replaces it, a cross-disk
+            # copy truncates it), so no existence checks are needed up front.
+            try:
+                _move_file(src, dst_path)
+            except FileNotFoundError:
+                return False
+            log(f"  [MERGED] {src} -> {dest_dir}/")
         else:
+            if not os.path.exists(src): return False
             if os.path.exists(dst_path):
-                print(f"  [DRY-RUN] rm {dst_path} && mv {src} ...")
+                log(f"  [DRY-RUN] rm {dst_path} && mv {src} ...")
             else:
-                print(f"  [DRY-RUN] mv {src} -> {dest_dir}/")
+                log(f"  [DRY-RUN] mv {src} -> {dest_dir}/")
         return True
     except Exception as e:
-        print(f"  [ERROR] Moving {src}: {e}")
+        log(f"  [ERROR] Moving {src}: {e}")
         return False
 
-def safe_delete(src, dry_run=True):
-    """Deletes a file."""
+def safe_delete(src, dry_run=True, dir_fd=None):
+    """
+    Deletes a file.
+    If dir_fd is given, src is removed by its basename relative to that open directory.
+    """
     try:
         if not dry_run:
-            if os.path.exists(src):
-                os.remove(src)
-                print(f"  [DELETED] {src}")
+            try:
+                if dir_fd is None:
+                    os.remove(src)
+                else:
+                    os.remove(os.path.basename(src), dir_fd=dir_fd)
+                log(f"  [DELETED] {src}")
+            except FileNotFoundError:
+                pass # Already gone
         else:
-            print(f"  [DRY-RUN] rm {src}")
+            log(f"  [DRY-RUN] rm {src}")
         return True
     except Exception as e:
-        print(f"  [ERROR] Deleting {src}: {e}")
+        log(f"  [ERROR] Deleting {src}: {e}")
         return False
 
-def cleanup_folder_tree(path, dry_run=True):
+def _clean_dir(path, name, parent_fd, dry_run):
     """
-    Recursively removes empty folders and cleans junk files from a directory tree.
-    Traverses bottom-up to ensure nested empty directories are removed.
+    Bottom-up worker for cleanup_folder_tree, visiting directories in os.walk order.
+    Where supported, each directory is opened once and everything below it (listing,
+    subdirectories, unlink, rmdir) is addressed relative to that fd instead of by full
+    path, so the kernel doesn't resolve every path component again per call.
     """
-    if not os.path.exists(path): return
+    fd = None
+    try:
+        if _USE_DIR_FD:
+            fd = os.open(name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=parent_fd)
+            with os.scandir(fd) as it:
+                entries = list(it)
+        else:
+            with os.scandir(path) as it:
+                entries = list(it)
+    except OSError:
+        # Unreadable directory: skip it, like os.walk does
+        if fd is not None: os.close(fd)
+        return
+
+    try:
+        prefix = path + os.sep
+        files = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry.name)
+            elif not entry.is_symlink():
+                # Like os.walk, symlinked directories are not followed
+                child = prefix + entry.name
+                _clean_dir(child, entry.name if fd is not None else child, fd, dry_run)
 
-    # Walk bottom-up
-    for root, dirs, files in os.walk(path, topdown=False):
         # Check files in current dir
         is_empty = True
         for f in files:
             if f.lower() in JUNK_FILES:
                 # It's junk. If we are cleaning, delete it.
-                junk_path = os.path.join(root, f)
-                safe_delete(junk_path, dry_run)
+                safe_delete(prefix + f, dry_run, dir_fd=fd)
             else:
                 # It's a real file (Video/Subtitle/etc). Folder is not empty.
                 is_empty = False
-        
-        # If no real files remain (or we just deleted the junk), try to remove dir
-        if is_empty:
-            # Re-check actual content in case safe_delete was dry-run
-            if not dry_run:
-                try:
-                    # Check if dirs are empty (they should be due to bottom-up walk)
-                    if not os.listdir(root):
-                        os.rmdir(root)
-                        print(f"  [CLEANUP] Removed empty dir: {root}")
-                except OSError:
-                    pass # Dir probably not empty
-            else:
-                # In dry run, we assume we deleted the junk, so we print intent
-                print(f"  [DRY-RUN] rmdir {root} (If empty)")
+    finally:
+        if fd is not None: os.close(fd)
+
+    # If no real files remain (or we just deleted the junk), try to remove dir
+    if is_empty:
+        if not dry_run:
+            try:
+                # Fails if anything is left (subdirs are already cleaned, being bottom-up)
+                os.rmdir(name, dir_fd=parent_fd)
+                log(f"  [CLEANUP] Removed empty dir: {path}")
+            except OSError:
+                pass # Dir probably not empty
+        else:
+            # In dry run, we assume we deleted the junk, so we print intent
+            log(f"  [DRY-RUN] rmdir {path} (If empty)")
+
+def cleanup_folder_tree(path, dry_run=True):
+    """
+    Recursively removes empty folders and cleans junk files from a directory tree.
+    Traverses bottom-up to ensure nested empty directories are removed.
+    """
+    if not os.path.exists(path): return
+    _clean_dir(path, path, None, dry_run)
 
 # --- Core Logic ---
 
-def scan_library(roots):
+@dataclass(slots=True)
+class DiskMeta:
+    """One disk's copy of a series: its folder name there and the bytes it holds."""
+    real_folder: str
+    total_size: int = 0
+
+@dataclass(slots=True)
+class SeriesEntry:
+    """A series as found across all disks (see scan_library)."""
+    display_name: str
+    disks: dict = field(default_factory=dict)      # root path -> DiskMeta
+    episodes: dict = field(default_factory=dict)   # (season, ep) -> [file entries]
+    artifacts: list = field(default_factory=list)  # non-episode files
+
+def _iter_dirs(path, in_extras=False):
     """
-    Scans all root directories for TV series and episodes.
-    Returns a dictionary structure grouping files by Series -> Season/Episode.
-    
-    Structure:
-    library[norm_key] = {
-      'display_name': "The Homers", (Best guess name)
-      'disks': {
-          '/mnt/hdd1': {'real_folder': 'The.Homers', 'total_size': 0},
-          '/mnt/hdd2': {'real_folder': 'The Homers', 'total_size': 0}
-      },
-      'episodes': { (season, ep): [List of file entries] },
-      'artifacts': [List of non-episode files]
-    }
+    Walks a directory tree top-down with os.scandir, in the same order as os.walk.
+    Yields (dirpath, file_entries, in_extras) for every directory, where file_entries are
+    the DirEntry objects of its files and in_extras tells whether the directory is (or is
+    inside) one of EXTRAS_DIRS. DirEntry caches the file type and stat() result,
+    so sizes don't need a second lookup by path.
     """
-    library = defaultdict(lambda: {
-        'display_name': None,
-        'disks': defaultdict(lambda: {'real_folder': '', 'total_size': 0}), 
-        'episodes': defaultdict(list),
-        'artifacts': []
-    })
-    
-    print(f"--- Scanning {len(roots)} paths ---")
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir():
+                    # Like os.walk, symlinked directories are not followed
+                    if not entry.is_symlink():
+                        subdirs.append((entry.path, in_extras or entry.name.lower() in EXTRAS_DIRS))
+                else:
+                    files.append(entry)
+    except OSError:
+        return
 
-    for root_path in roots:
-        real_root = os.path.abspath(root_path)
-        if not os.path.exists(real_root):
-            print(f"[!] Warning: Path not found: {root_path}")
-            continue
+    yield path, files, in_extras
+    for subdir, sub_extras in subdirs:
+        yield from _iter_dirs(subdir, sub_extras)
 
-        print(f"Scanning: {root_path}")
-        
-        try:
-            series_dirs = [d for d in os.listdir(real_root) if os.path.isdir(os.path.join(real_root, d))]
-        except OSError as e:
-            print(f"[!] Error reading {root_path}: {e}")
-            continue
+def get_entry_size(entry):
+    """Returns the size of a DirEntry in bytes, or -1 on error."""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return -1
 
-        for folder_name in series_dirs:
-            norm_key = normalize_name(folder_name)
-            series_path = os.path.join(real_root, folder_name)
-            
-            # Store metadata about this specific variant
-            lib_entry = library[norm_key]
+def _scan_series(root_path, real_root, folder_name):
+    """
+    Scans one series folder on one disk.
+    Returns (folder_name, disk_size, episodes, artifacts), where episodes is a
+    list of ((season, ep), file entry) pairs and disk_size the bytes found on this disk.
+    """
+    series_path = os.path.join(real_root, folder_name)
+    # _iter_dirs builds subfolder paths by appending to series_path, so the relative
+    # folder is a plain slice of this prefix (no relpath normalization needed)
+    prefix_len = len(series_path) + len(os.sep)
+    episodes = []
+    artifacts = []
+    disk_size = 0
+
+    # Walk files
+    for dirpath, file_entries, in_extras in _iter_dirs(series_path):
+        # Calculate relative structure using the *current* folder name
+        rel_dir = dirpath[prefix_len:]
+
+        # 1. Group SxxExx within this folder
+        local_ep_groups = defaultdict(list)
+        # Every file in this folder, in directory order. Episodes pop their files out;
+        # whatever remains at the end is an artifact.
+        unclaimed = {}
+
+        for entry in file_entries:
+            f = entry.name
+            unclaimed[f] = entry
+            # Bonus material skips episode matching and falls through to artifacts
+            match = None if in_extras else PATTERN.search(f)
+            if match:
+                s_num = int(match.group(1))
+                e_num = int(match.group(2))
+                local_ep_groups[(s_num, e_num)].append({
+                    'filename': f, 'path': entry.path, 'size': get_entry_size(entry)
+                })
+
+        # 2. Process Groups (Local Highlander Logic)
+        # If multiple files match SxxExx in this folder, pick the largest as the "Episode"
+        # and attach others as "Companions" (or duplicates to be moved along).
+        for (s, e), group in local_ep_groups.items():
+            group.sort(key=lambda x: x['size'], reverse=True)
+            candidate = group[0]
             
-            # Set display name if not set (or overwrite if this one looks "nicer" - strict heuristic omitted for simplicity)
-            if not lib_entry['display_name']:
-                lib_entry['display_name'] = folder_name
+            if candidate['size'] > MIN_VIDEO_SIZE:
+                del unclaimed[candidate['filename']]
                 
-            lib_entry['disks'][root_path]['real_folder'] = folder_name
-
-            # Walk files
-            for dirpath, _, filenames in os.walk(series_path):
-                # Calculate relative structure using the *current* folder name
-                rel_dir = os.path.relpath(dirpath, series_path)
-                if rel_dir == ".": rel_dir = ""
-
-                # 1. Group SxxExx within this folder
-                local_ep_groups = defaultdict(list)
-                unmatched_files = []
-
-                for f in filenames:
-                    match = PATTERN.search(f)
-                    if match:
-                        s_num = int(match.group(1))
-                        e_num = int(match.group(2))
-                        f_path = os.path.join(dirpath, f)
-                        size = get_file_info(f_path)
-                        local_ep_groups[(s_num, e_num)].append({
-                            'filename': f, 'path': f_path, 'size': size, 'match_end': match.end()
-                        })
+                companions = []
+                total_size = candidate['size']
+                
+                # Add smaller SxxExx files as companions
+                for other in group[1:]:
+                    del unclaimed[other['filename']]
+                    companions.append({'path': other['path'], 'size': other['size']})
+                    total_size += other['size']
+
+                # Files sharing the episode's basename (e.g. 'Show.S01E05.en.srt') contain the
+                # SxxExx token themselves, so they already landed in this group above.
+
+                entry = {
+                    'path': candidate['path'],
+                    'size': candidate['size'],
+                    'total_size': total_size,
+                    'disk': root_path,
+                    'rel_dir': rel_dir, # e.g. "Season 1"
+                    'companions': companions
+                }
+                episodes.append(((s, e), entry))
+                
+                # Track total size for this disk/series combo
+                disk_size += total_size
+
+        # 3. Artifacts (Images, NFOs, leftovers)
+        for f, entry in unclaimed.items():
+            if f.startswith('.'): continue
+            size = get_entry_size(entry)
+            artifacts.append({
+                'path': entry.path, 'disk': root_path, 'rel_dir': rel_dir, 'size': size
+            })
+            disk_size += size
+
+    return folder_name, disk_size, episodes, artifacts
+
+def _list_series_dirs(root_path):
+    """
+    Lists the series folders of one root directory (usually a whole disk).
+    Returns (real_root, folder names in listing order), or None if the root is unusable.
+    """
+    real_root = os.path.abspath(root_path)
+    if not os.path.exists(real_root):
+        log(f"[!] Warning: Path not found: {root_path}")
+        return None
+
+    log(f"Scanning: {root_path}")
+
+    try:
+        with os.scandir(real_root) as it:
+            return real_root, [e.name for e in it if e.is_dir()]
+    except OSError as e:
+        log(f"[!] Error reading {root_path}: {e}")
+        return None
+
+def _stream_series(folders_by_key, roots_count):
+    """
+    Scans the given series folders and yields (norm_key, SeriesEntry) in name order.
+    Only SCAN_AHEAD series are scanned ahead of the consumer, so memory stays bounded by
+    that window instead of growing with the size of the library.
+    """
+    keys = iter(sorted(folders_by_key))
+    window = deque()
+
+    # Series folders are independent, so scanning several at once overlaps their I/O latency
+    with ThreadPoolExecutor(max_workers=max(1, min(32, SERIES_SCAN_WORKERS * roots_count))) as executor:
+        def submit_next():
+            norm_key = next(keys, None)
+            if norm_key is None: return
+            window.append((norm_key, [
+                (root_path, executor.submit(_scan_series, root_path, real_root, folder_name))
+                for root_path, real_root, folder_name in folders_by_key.pop(norm_key)
+            ]))
+
+        for _ in range(SCAN_AHEAD):
+            submit_next()
+
+        while window:
+            norm_key, scans = window.popleft()
+            submit_next()
+
+            # Merge in the order the roots were given, which keeps display names and
+            # tie-breaks stable. The first folder seen becomes the display name
+            # (a "nicer name" heuristic is omitted for simplicity).
+            lib_entry = None
+            for root_path, future in scans:
+                folder_name, disk_size, episodes, artifacts = future.result()
+                if lib_entry is None:
+                    lib_entry = SeriesEntry(folder_name)
+
+                # Store metadata about this specific variant
+                disk_meta = lib_entry.disks.get(root_path)
+                if disk_meta is None:
+                    disk_meta = lib_entry.disks[root_path] = DiskMeta(folder_name)
+                else:
+                    disk_meta.real_folder = folder_name
+                disk_meta.total_size += disk_size
+
+                lib_episodes = lib_entry.episodes
+                for key, entry in episodes:
+                    copies = lib_episodes.get(key)
+                    if copies is None:
+                        lib_episodes[key] = [entry]
                     else:
-                        unmatched_files.append(f)
+                        copies.append(entry)
+                lib_entry.artifacts.extend(artifacts)
 
-                # 2. Process Groups (Local Highlander Logic)
-                # If multiple files match SxxExx in this folder, pick the largest as the "Episode"
-                # and attach others as "Companions" (or duplicates to be moved along).
-                files_claimed = set()
-                
-                for (s, e), group in local_ep_groups.items():
-                    group.sort(key=lambda x: x['size'], reverse=True)
-                    candidate = group[0]
-                    
-                    if candidate['size'] > MIN_VIDEO_SIZE:
-                        files_claimed.add(candidate['filename'])
-                        
-                        companions = []
-                        total_size = candidate['size']
-                        
-                        # Add smaller SxxExx files as companions
-                        for other in group[1:]:
-                            files_claimed.add(other['filename'])
-                            companions.append({'path': other['path'], 'size': other['size']})
-                            total_size += other['size']
-
-                        # Add prefix-matched unmatched files (e.g., subtitles with same basename)
-                        prefix = candidate['filename'][:candidate['match_end']]
-                        for um_f in unmatched_files:
-                            if um_f in files_claimed: continue
-                            if um_f.startswith(prefix):
-                                um_path = os.path.join(dirpath, um_f)
-                                um_size = get_file_info(um_path)
-                                companions.append({'path': um_path, 'size': um_size})
-                                total_size += um_size
-                                files_claimed.add(um_f)
-
-                        entry = {
-                            'path': candidate['path'],
-                            'size': candidate['size'],
-                            'total_size': total_size,
-                            'disk': root_path,
-                            'rel_dir': rel_dir, # e.g. "Season 1"
-                            'companions': companions
-                        }
-                        lib_entry['episodes'][(s, e)].append(entry)
-                        
-                        # Track total size for this disk/series combo
-                        lib_entry['disks'][root_path]['total_size'] += total_size
-
-                # 3. Artifacts (Images, NFOs, leftovers)
-                for f in filenames:
-                    if f not in files_claimed:
-                        if f.startswith('.'): continue
-                        f_path = os.path.join(dirpath, f)
-                        size = get_file_info(f_path)
-                        lib_entry['artifacts'].append({
-                            'path': f_path, 'disk': root_path, 'rel_dir': rel_dir, 'size': size
-                        })
-                        lib_entry['disks'][root_path]['total_size'] += size
-
-    return library
+            yield norm_key, lib_entry
+
+def scan_library(roots):
+    """
+    Scans all root directories for TV series and episodes.
+    Returns an iterator of (norm_key, SeriesEntry) pairs in name order, grouping files
+    by Series -> Season/Episode. Root folders are listed right away; series folders are
+    scanned lazily as the iterator is consumed.
+    Series that live on a single root are left out: there is nothing to consolidate,
+    so their files are never scanned.
+    
+    Structure:
+    library[norm_key] = SeriesEntry(
+      display_name="The Homers", (Best guess name)
+      disks={
+          '/mnt/hdd1': DiskMeta(real_folder='The.Homers', total_size=0),
+          '/mnt/hdd2': DiskMeta(real_folder='The Homers', total_size=0)
+      },
+      episodes={ (season, ep): [List of file entries] },
+      artifacts=[List of non-episode files]
+    )
+    """
+    log(f"--- Scanning {len(roots)} paths ---")
+
+    # Roots are usually separate disks, so they are listed in parallel
+    folders_by_key = defaultdict(list)
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(roots)))) as executor:
+        for root_path, listing in zip(roots, executor.map(_list_series_dirs, roots)):
+            if listing is None: continue
+            real_root, series_dirs = listing
+            for folder_name in series_dirs:
+                folders_by_key[normalize_name(folder_name)].append((root_path, real_root, folder_name))
+
+    multi_disk = {
+        norm_key: folders for norm_key, folders in folders_by_key.items()
+        if len({root_path for root_path, _, _ in folders}) > 1
+    }
+    return _stream_series(multi_disk, len(roots))
+
+def consolidate_episode(s, e, copies, target_disk, target_prefix, dry_run=True):
+    """
+    Brings one episode onto the target disk: moves a copy there if it is missing, then
+    deletes the redundant copies on the other disks.
+    Returns the number of bytes that now take up space on the target's filesystem
+    (a rename from a root on the same filesystem takes none).
+    """
+    on_target = [c for c in copies if c['disk'] == target_disk]
+    others = [c for c in copies if c['disk'] != target_disk]
+    moved_bytes = 0
+
+    if on_target:
+        # The episode already exists on the target disk.
+        # Since we passed the "Conflicting Duplicates" check, we know the 'others' are identical size.
+        # We can safely delete the copies on other disks.
+        for c in others:
+            safe_delete(c['path'], dry_run)
+            for comp in c['companions']: safe_delete(comp['path'], dry_run)
+    else:
+        # The episode is missing from target. Move it there.
+        src = others[0]
+        dest_dir = target_prefix + src['rel_dir']
+
+        if safe_move(src['path'], dest_dir, dry_run):
+            moved_bytes += src['size']
+            # Move companions (subtitles etc) - force_move handles potential overwrites if junk exists
+            for comp in src['companions']:
+                if force_move(comp['path'], dest_dir, dry_run):
+                    moved_bytes += max(comp['size'], 0)
+            # Another root on the same filesystem: the moves were renames and used no space
+            if get_fs_id(src['disk']) == get_fs_id(target_disk):
+                moved_bytes = 0
+            # If there were multiple copies on source disks (redundant), delete them now
+            for redundant in others[1:]:
+                safe_delete(redundant['path'], dry_run)
+                for comp in redundant['companions']: safe_delete(comp['path'], dry_run)
+        else:
+            log(f"  [ABORT] Move failed for S{s}E{e}.")
+
+    return moved_bytes
 
 def process_consolidation(library, execute=False):
     """
     Analyzes the library structure and performs/simulates the consolidation.
+    library is the (norm_key, SeriesEntry) iterator from scan_library; each series is
+    handled as soon as it has been scanned.
     Returns a list of skipped series (log messages).
     """
-    print("\n--- Starting Consolidation Analysis ---")
+    log("\n--- Starting Consolidation Analysis ---")
     if execute:
-        print("!!! LIVE MODE - Files will be MOVED and DELETED !!!\n")
+        log("!!! LIVE MODE - Files will be MOVED and DELETED !!!\n")
     else:
-        print("!!! DRY RUN MODE - No files will be moved !!!\n")
+        log("!!! DRY RUN MODE - No files will be moved !!!\n")
 
     skipped_log = []
     
-    for norm_key in sorted(library.keys()):
-        data = library[norm_key]
-        display_name = data['display_name']
-        episodes = data['episodes']
-        artifacts = data['artifacts']
+    for norm_key, data in library:
+        display_name = data.display_name
+        episodes = data.episodes
+        artifacts = data.artifacts
         # Set of root paths involved
-        involved_disks = list(data['disks'].keys())
+        involved_disks = list(data.disks.keys())
         
         # Skip if entirely on one disk already
         if len(involved_disks) <= 1:
             continue
 
-        print(f"Processing: {display_name} (Found on {len(involved_disks)} disks)...")
+        log(f"Processing: {display_name} (Found on {len(involved_disks)} disks)...")
 
         # 1. Safety Check: Conflicting Duplicates
         # If the same episode exists on multiple disks with DIFFERENT sizes, we skip the series.
@@ -349,91 +679,89 @@ def process_consolidation(library, execute=False):
         has_bad_dupe = False
         for (s, e), copies in episodes.items():
             if len(copies) > 1:
-                sizes = set(c['size'] for c in copies)
-                if len(sizes) > 1:
+                # Stops at the first copy that differs from the first one
+                first = copies[0]['size']
+                if any(c['size'] != first for c in copies[1:]):
                     has_bad_dupe = True
                     break
         
         if has_bad_dupe:
             msg = f"SKIPPED {display_name}: Conflicting duplicates (different sizes) found."
-            print(f"  [!] {msg}")
+            log(f"  [!] {msg}")
             skipped_log.append(msg)
             continue
 
         # 2. Select Target Disk
         # We want to move everything to the disk that already has the MOST content for this show.
         # Sort candidates by total size held (descending)
-        candidates = sorted(data['disks'].items(), key=lambda x: x[1]['total_size'], reverse=True)
+        candidates = sorted(data.disks.items(), key=lambda x: x[1].total_size, reverse=True)
         
         target_disk = None
         target_series_folder_name = None
         plan_import_size = 0
         
+        # Index what each disk already holds, so candidates don't rescan every copy
+        present = defaultdict(set)
+        for key, copies in episodes.items():
+            for c in copies:
+                present[c['disk']].add(key)
+        art_size_by_disk = Counter()
+        for art in artifacts:
+            art_size_by_disk[art['disk']] += art['size']
+        art_total = sum(art_size_by_disk.values())
+
         for disk_path, meta in candidates:
             # Calculate import size (how much we need to move TO this disk)
-            bytes_needed = 0
-            
             # Sum up episodes NOT on this disk
-            for (s, e), copies in episodes.items():
-                if not any(c['disk'] == disk_path for c in copies):
-                    bytes_needed += copies[0]['total_size']
-            
+            on_disk = present[disk_path]
+            bytes_needed = sum(copies[0]['total_size'] for key, copies in episodes.items() if key not in on_disk)
+
             # Sum up artifacts NOT on this disk
-            for art in artifacts:
-                if art['disk'] != disk_path:
-                    bytes_needed += art['size']
+            bytes_needed += art_total - art_size_by_disk[disk_path]
             
             # Check free space
-            if (get_free_space(disk_path) - bytes_needed) > MIN_FREE_BUFFER:
+            if (get_free_space_cached(disk_path) - bytes_needed) > MIN_FREE_BUFFER:
                 target_disk = disk_path
                 # CRITICAL: Use the folder name that ALREADY EXISTS on the target disk
-                target_series_folder_name = meta['real_folder']
+                target_series_folder_name = meta.real_folder
                 plan_import_size = bytes_needed
                 break
         
         if not target_disk:
             msg = f"SKIPPED {display_name}: No candidate disk has enough free space."
-            print(f"  [!] {msg}")
+            log(f"  [!] {msg}")
             skipped_log.append(msg)
             continue
 
         # 3. Execute Actions
-        print(f"  -> Consolidating to: {target_disk}/{target_series_folder_name}")
+        log(f"  -> Consolidating to: {target_disk}/{target_series_folder_name}")
         target_root_full = os.path.join(target_disk, target_series_folder_name)
+        target_prefix = target_root_full + os.sep
+        target_fs = get_fs_id(target_disk)
+        moved_bytes = 0
 
         # A) Episodes
-        for (s, e), copies in episodes.items():
-            on_target = [c for c in copies if c['disk'] == target_disk]
-            others = [c for c in copies if c['disk'] != target_disk]
-            
-            if on_target:
-                # The episode already exists on the target disk.
-                # Since we passed the "Conflicting Duplicates" check, we know the 'others' are identical size.
-                # We can safely delete the copies on other disks.
-                for c in others:
-                    safe_delete(c['path'], not execute)
-                    for comp in c['companions']: safe_delete(comp['path'], not execute)
-            else:
-                # The episode is missing from target. Move it there.
-                src = others[0]
-                dest_dir = os.path.join(target_root_full, src['rel_dir'])
-                
-                if safe_move(src['path'], dest_dir, not execute):
-                    # Move companions (subtitles etc) - force_move handles potential overwrites if junk exists
-                    for comp in src['companions']:
-                        force_move(comp['path'], dest_dir, not execute)
-                    # If there were multiple copies on source disks (redundant), delete them now
-                    for redundant in others[1:]:
-                        safe_delete(redundant['path'], not execute)
-                        for comp in redundant['companions']: safe_delete(comp['path'], not execute)
-                else:
-                    print(f"  [ABORT] Move failed for S{s}E{e}.")
+        # Every episode only touches its own files, so in live mode they are handled
+        # concurrently to overlap the per-file round trips on network mounts.
+        # Dry runs stay sequential so the printed plan reads in order.
+        def run_episode(item):
+            (s, e), copies = item
+            return consolidate_episode(s, e, copies, target_disk, target_prefix, not execute)
+
+        if execute:
+            with ThreadPoolExecutor(max_workers=ACTION_WORKERS) as executor:
+                moved_bytes += sum(executor.map(run_episode, episodes.items()))
+        else:
+            moved_bytes += sum(map(run_episode, episodes.items()))
 
         # B) Artifacts
+        # Kept sequential: artifacts from different disks may share a name (poster.jpg),
+        # and the last one moved has to win deterministically.
         for art in artifacts:
             if art['disk'] != target_disk:
-                dest_dir = os.path.join(target_root_full, art['rel_dir'])
-                force_move(art['path'], dest_dir, not execute)
+                dest_dir = target_prefix + art['rel_dir']
+                if force_move(art['path'], dest_dir, not execute) and get_fs_id(art['disk']) != target_fs:
+                    moved_bytes += max(art['size'], 0)
 
         # 4. Cleanup Source Folders
         # Iterate all disks that were NOT the target, and clean their specific folder for this series
@@ -441,12 +769,21 @@ def process_consolidation(library, execute=False):
             if disk_path == target_disk: continue
             
             # The folder name on THIS specific disk
-            source_folder_name = data['disks'][disk_path]['real_folder']
+            source_folder_name = data.disks[disk_path].real_folder
             source_full_path = os.path.join(disk_path, source_folder_name)
             
-            print(f"  -> Cleaning source: {source_full_path}")
+            log(f"  -> Cleaning source: {source_full_path}")
             cleanup_folder_tree(source_full_path, not execute)
 
+        # Keep the cached free space of the target filesystem (shared by every root on it)
+        # in step with what we just put there. The source filesystems gained space from the
+        # moves and deletes, so forget their values; they are measured again on next use.
+        if execute:
+            _free_cache[target_fs] -= moved_bytes
+            for disk_path in involved_disks:
+                if disk_path != target_disk:
+                    _free_cache.pop(get_fs_id(disk_path), None)
+
     return skipped_log
 
 def main():
@@ -459,9 +796,9 @@ def main():
     skipped = process_consolidation(library, args.execute)
     
     if skipped:
-        print("\n--- Skipped Series Report ---")
+        log("\n--- Skipped Series Report ---")
         for line in skipped:
-            print(line)
+            log(line)
 
 if __name__ == "__main__":
     main()